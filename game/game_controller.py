@@ -21,7 +21,7 @@ from game.monster_ai import MonsterManager
 from game.combat import CombatManager, CombatResult
 from game.dungeon_map import DungeonMap
 from game.game_state import GameState
-from ui.signals import AppSignals
+from ui.signals import AppSignals, MapState, PlayerHP, RoomView
 
 # ── Worker Threads ─────────────────────────────────────────────────────────────
 
@@ -238,14 +238,8 @@ class GameController(QObject):
         payload = {
             "room": room,
             "exits": exits,
-            "player": {
-                "current_room": room_id,
-                "hp":           self._state.hp,
-                "max_hp":       self._state.max_hp,
-                "inventory":    self._state.inventory,
-            },
         }
-        self._signals.state_updated.emit(payload)
+        self._signals.state_updated.emit(payload, PlayerHP(self._state.hp, self._state.max_hp))
 
     def _emit_room_items(self) -> None:
         """Emit room_items_changed for the current room."""
@@ -264,36 +258,35 @@ class GameController(QObject):
             monsters_by_room.setdefault(rid, []).append(mid)
 
         unlocked = set(self._state.unlocked_rooms)
-        rooms_payload: dict[str, dict] = {}
+        rooms_payload: dict[str, RoomView] = {}
 
         for room_id in self._dungeon.all_room_ids:
-            item_names = [
+            item_names = tuple(
                 self._item_registry[iid]["name"]
                 for iid in self._state.get_room_items(room_id)
                 if iid in self._item_registry
-            ]
-            monster_names = [
+            )
+            monster_names = tuple(
                 self._monster_registry[mid]["name"]
                 for mid in monsters_by_room.get(room_id, [])
                 if mid in self._monster_registry
-            ]
+            )
             boss_id      = self._dungeon.get_boss_id(room_id)
             boss_name    = self._boss_registry[boss_id]["name"] if boss_id else None
             boss_cleared = self._state.is_boss_cleared(boss_id) if boss_id else False
             is_locked    = self._dungeon.is_locked(room_id) and room_id not in unlocked
 
-            rooms_payload[room_id] = {
-                "items":        item_names,
-                "monsters":     monster_names,
-                "boss":         boss_name,
-                "boss_cleared": boss_cleared,
-                "locked":       is_locked,
-            }
-
-        self._signals.map_state_changed.emit({
-            "player_room": self._state.current_room_id,
-            "rooms":       rooms_payload,
-        })
+            rooms_payload[room_id] = RoomView(
+                items=item_names,
+                monsters=monster_names,
+                boss=boss_name,
+                boss_cleared=boss_cleared,
+                locked=is_locked,
+            )
+
+        self._signals.map_state_changed.emit(
+            MapState(self._state.current_room_id, rooms_payload)
+        )
 
     def _equipment_payload(self) -> dict:
         """Build the dict payload for inventory_updated: {equipped, bag}."""
@@ -747,6 +740,7 @@ class GameController(QObject):
         self._state.save()
 
         self._signals.combat_updated.emit({
+            "name":          self._current_enemy["name"],
             "player_hp":     new_player_hp,
             "player_max_hp": self._state.max_hp,
             "enemy_hp":      new_enemy_hp,
@@ -1,9 +1,15 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
-    QGraphicsDropShadowEffect, QGraphicsOpacityEffect, QScrollArea, QProgressBar
+    QGraphicsDropShadowEffect, QProgressBar
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QPainter, QLinearGradient, QColor, QBrush
+from PyQt6.QtCore import Qt, QObject, QPoint, QRect, QRectF, QSize, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QImage, QPixmap, QPixmapCache, QPainter, QLinearGradient, QColor, QBrush, QFont, QPen
+)
+
+from functools import cache, lru_cache
+from math import ceil
+from pathlib import Path
 
 from config import (
     BG_COLOR, TEXT_COLOR, ACCENT_COLOR, STATUS_COLOR, 
@@ -12,11 +18,12 @@ from config import (
 
 _ICONS_DIR = ASSETS_DIR / "icons"
 _ICON_SIZE  = 28
-_MONSTER_ICON_SIZE = 48 # Ikon monster dibuat lebih besar
 
 _ITEM_ICONS_DIR = ASSETS_DIR / "item_icons"
 _ITEM_ICON_SIZE = 42
 
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
 # Font Stacks
 _FONT_TITLE = "'Cinzel', 'Georgia', serif"
 _FONT_BODY  = "'Lora', 'Georgia', 'Times New Roman', serif"
@@ -55,50 +62,132 @@ _MONSTER_IMG_MAP = {
     "Dungeon Crawler": "crawler.png"
 }
 
+# Cache pixmap global Qt (LRU, dalam KB) — dipakai bersama oleh semua widget.
+# Ikon kecil + beberapa background ruangan (~17 MB per gambar 2816x1536)
+QPixmapCache.setCacheLimit(96 * 1024)
+
+def _set_if_changed(lbl: QLabel, text: str) -> None:
+    """setText hanya jika teks berubah — QLabel tetap invalidasi layout + repaint untuk teks identik."""
+    if lbl.text() != text:
+        lbl.setText(text)
+
+def _pixmap_from_path(p: Path) -> QPixmap:
+    """Decode lewat QImage lalu konversi ke QPixmap (lebih cepat di PyQt6)."""
+    return QPixmap.fromImage(QImage(str(p)))
+
+def _cached_icon(path: Path, size: int) -> QPixmap | None:
+    """Load + scale sekali per (path, size); hasil berikutnya diambil dari QPixmapCache."""
+    key = f"{path}@{size}"
+    px = QPixmapCache.find(key)
+    if px is None:
+        raw = _pixmap_from_path(path)
+        if raw.isNull(): return None
+        # Menggunakan SmoothTransformation agar gambar besar tidak pecah
+        px = raw.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        QPixmapCache.insert(key, px)
+    return px
+
 def _load_monster_image(name: str, size: int) -> QPixmap | None:
     """Memuat gambar monster dengan resolusi tinggi."""
     filename = _MONSTER_IMG_MAP.get(name)
     if filename:
-        px = QPixmap(str(_MONSTERS_DIR / filename))
-        if not px.isNull():
-            # Menggunakan SmoothTransformation agar gambar besar tidak pecah
-            return px.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        px = _cached_icon(_MONSTERS_DIR / filename, size)
+        if px: return px
     
     # Fallback tetap menggunakan boss_icon
-    px = QPixmap(str(_ICONS_DIR / "boss_icon.png"))
-    if not px.isNull():
-        return px.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-    return None
+    return _cached_icon(_ICONS_DIR / "boss_icon.png", size)
 
 def _load_icon(name: str, size: int = _ICON_SIZE) -> QPixmap | None:
-    px = QPixmap(str(_ICONS_DIR / name))
-    if px.isNull(): return None
-    return px.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return _cached_icon(_ICONS_DIR / name, size)
+
+@cache
+def _heart_pixmap() -> QPixmap | None:
+    """Singleton ikon heart. Tidak bisa di-load saat import: QPixmap butuh QApplication,
+    sedangkan main.py meng-import UI sebelum QApplication dibuat."""
+    return _load_icon("heart.png")
+
+class _ShadowLabel(QLabel):
+    """QLabel with a cheap offset text shadow, drawn directly instead of via QGraphicsDropShadowEffect."""
+
+    _SHADOW_COLOR  = QColor(0, 0, 0, 150)
+    _SHADOW_OFFSET = 2
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self._SHADOW_COLOR)
+        flags = self.alignment().value
+        if self.wordWrap():
+            flags |= Qt.TextFlag.TextWordWrap.value
+        painter.drawText(self.contentsRect().translated(0, self._SHADOW_OFFSET), flags, self.text())
+        painter.end()
+        super().paintEvent(event)
+
+
+class _ImageLoadSignals(QObject):
+    loaded = pyqtSignal(str, QImage)   # (path, decoded image)
+
+
+class _ImageLoadTask(QRunnable):
+    """Decode a room image off the GUI thread (QImage is safe to build off-thread, QPixmap is not)."""
+
+    def __init__(self, path: str, signals: _ImageLoadSignals):
+        super().__init__()
+        self._path    = path
+        # Satu-satunya referensi ke signals (tanpa parent) — tetap hidup walau widget
+        # penerimanya sudah dihapus; koneksinya diputus Qt bersama widget tsb
+        self._signals = signals
+
+    def run(self) -> None:
+        self._signals.loaded.emit(self._path, QImage(self._path))
+
 
 class RoomImageWidget(QWidget):
     """Custom widget for top-half image with Combat Dimming and Large Monster Overlay."""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.pixmap: QPixmap | None = None
+        self._image_path: str | None = None
+        # Hasil scale pixmap untuk ukuran widget saat ini (di-reset saat resize / ganti gambar)
+        self._scaled_cache: QPixmap | None = None
+        self._scaled_size: QSize | None = None
+        self._crop_offset = QPoint(0, 0)   # offset crop tengah, dihitung bersama _scaled_cache
+        self._src_rect: QRectF | None = None  # area sumber (KeepAspectRatioByExpanding) untuk ukuran saat ini
+        # Strip gradient fade-out bawah, di-render sekali per lebar widget
+        self._gradient_px: QPixmap | None = None
+        # Selama resize interaktif pakai FastTransformation; smooth lagi setelah 100ms diam
+        self._resizing = False
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(100)
+        self._settle_timer.timeout.connect(self._settle)
         self.setFixedHeight(350) 
         self._is_combat = False # Flag untuk efek dimming
-        self._build_monster_overlay()
+        self._last_monster_name: str | None = None
+        # Overlay monster baru dibangun saat combat pertama (lihat monster_container)
+        self._monster_container: QWidget | None = None
+
+    @property
+    def monster_container(self) -> QWidget:
+        if self._monster_container is None:
+            self._build_monster_overlay()
+        return self._monster_container
 
     def _build_monster_overlay(self):
         main_layout = QVBoxLayout(self)
-        main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.setAlignment(_ALIGN_CENTER)
         
-        self.monster_container = QWidget()
-        self.monster_container.setStyleSheet("background: transparent;")
+        self._monster_container = QWidget()
+        self._monster_container.setStyleSheet("background: transparent;")
         
-        overlay_layout = QVBoxLayout(self.monster_container)
-        overlay_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        overlay_layout = QVBoxLayout(self._monster_container)
+        overlay_layout.setAlignment(_ALIGN_CENTER)
         overlay_layout.setContentsMargins(0, 0, 0, 0)
         overlay_layout.setSpacing(12)
 
         # 1. Nama Monster (Warna Emas/Putih + Shadow Tebal agar terbaca)
         self.lbl_m_name = QLabel("Unknown Threat")
-        self.lbl_m_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_m_name.setAlignment(_ALIGN_CENTER)
         self.lbl_m_name.setWordWrap(True)
         # Menggunakan warna ACCENT_COLOR agar kontras dengan background gelap
         self.lbl_m_name.setStyleSheet(
@@ -106,9 +195,10 @@ class RoomImageWidget(QWidget):
             f"background: transparent; border: none; font-family: {_FONT_TITLE};"
         )
         
-        # Shadow dibuat sangat tebal (Blur 15, Offset 0) untuk menciptakan 'outline' hitam
+        # Shadow tebal (Blur 7, Offset 0) untuk menciptakan 'outline' hitam;
+        # radius kecil menjaga biaya blur tetap murah tiap repaint
         name_shadow = QGraphicsDropShadowEffect(self)
-        name_shadow.setBlurRadius(15)
+        name_shadow.setBlurRadius(7)
         name_shadow.setColor(QColor(0, 0, 0, 255))
         name_shadow.setOffset(0, 0)
         self.lbl_m_name.setGraphicsEffect(name_shadow)
@@ -119,7 +209,9 @@ class RoomImageWidget(QWidget):
         self.bar_m_hp.setFixedWidth(220)
         self.bar_m_hp.setFixedHeight(18)
         self.bar_m_hp.setTextVisible(True)
-        self.bar_m_hp.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Qt mengisi %v / %m sendiri dari value/maximum — tak perlu setFormat tiap update
+        self.bar_m_hp.setFormat("%v / %m HP")
+        self.bar_m_hp.setAlignment(_ALIGN_CENTER)
         self.bar_m_hp.setStyleSheet(f"""
             QProgressBar {{
                 background-color: rgba(0, 0, 0, 200);
@@ -144,67 +236,403 @@ class RoomImageWidget(QWidget):
 
         # 3. Ikon / Gambar Monster (Sangat Besar: 280px)
         self.lbl_m_icon = QLabel()
-        self.lbl_m_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_m_icon.setAlignment(_ALIGN_CENTER)
         self.lbl_m_icon.setStyleSheet("background: transparent; border: none;")
         
         img_shadow = QGraphicsDropShadowEffect(self)
-        img_shadow.setBlurRadius(25)
+        img_shadow.setBlurRadius(12)
         img_shadow.setColor(QColor(0, 0, 0, 200))
         img_shadow.setOffset(0, 5)
         self.lbl_m_icon.setGraphicsEffect(img_shadow)
         
         overlay_layout.addWidget(self.lbl_m_icon)
 
-        main_layout.addWidget(self.monster_container)
-        self.monster_container.setVisible(False)
+        main_layout.addWidget(self._monster_container)
+        self._monster_container.setVisible(False)
 
     def set_image(self, path: str) -> None:
-        self.pixmap = QPixmap(path)
+        if path == self._image_path:
+            return
+        self._image_path = path
+
+        # Ruangan yang pernah dikunjungi: langsung dari QPixmapCache (key = path)
+        cached = QPixmapCache.find(path)
+        if cached is not None:
+            self._apply_pixmap(cached)
+            return
+        # Decode di thread pool; pixmap lama tetap tampil sampai yang baru siap
+        signals = _ImageLoadSignals()
+        signals.loaded.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(_ImageLoadTask(path, signals))
+
+    def _on_image_loaded(self, path: str, image: QImage) -> None:
+        if image.isNull():
+            return
+        pm = QPixmap.fromImage(image)
+        QPixmapCache.insert(path, pm)
+        # Abaikan hasil decode yang sudah basi (pemain sudah pindah ruangan lagi)
+        if path == self._image_path:
+            self._apply_pixmap(pm)
+
+    def _apply_pixmap(self, pm: QPixmap) -> None:
+        self.pixmap = pm
+        self._scaled_cache = None
+        self._src_rect = None
         self.update()
 
     def show_monster(self, name: str, hp: int, max_hp: int):
         self._is_combat = True
-        self.lbl_m_name.setText(name)
+        container = self.monster_container
         self.bar_m_hp.setMaximum(max_hp)
         self.bar_m_hp.setValue(hp)
-        self.bar_m_hp.setFormat(f"{hp} / {max_hp} HP")
-        
-        # Scale Up Monster ke 280px agar mendominasi layar
-        px = _load_monster_image(name, 300)
-        if px: 
-            self.lbl_m_icon.setPixmap(px)
-        
-        self.monster_container.setVisible(True)
+
+        # Nama + gambar (dan shadow-nya) hanya di-render ulang saat monster berganti
+        if name != self._last_monster_name:
+            self.lbl_m_name.setText(name)
+            # Scale Up Monster ke 280px agar mendominasi layar
+            px = _load_monster_image(name, 300)
+            if px: 
+                self.lbl_m_icon.setPixmap(px)
+            self._last_monster_name = name
+
+        container.setVisible(True)
         self.update() # Memicu paintEvent untuk efek dimming
 
     def hide_monster(self):
         self._is_combat = False
-        self.monster_container.setVisible(False)
+        if self._monster_container is not None:
+            self._monster_container.setVisible(False)
         self.update()
 
+    _FADE_H = 80
+
+    def resizeEvent(self, event) -> None:
+        # Mode resize cepat hanya bila sudah ada hasil scale yang dibuang (resize
+        # interaktif); resize pertama saat show() langsung ke jalur smooth
+        if self._resizing or self._scaled_cache is not None:
+            self._resizing = True
+            self._settle_timer.start()
+        self._scaled_cache = None
+        self._src_rect = None
+        if self._gradient_px is not None and self._gradient_px.width() != self.width():
+            self._gradient_px = None
+        super().resizeEvent(event)
+
+    def _settle(self) -> None:
+        self._resizing = False
+        self._scaled_cache = None
+        self.update()
+
+    def _source_rect(self) -> QRectF:
+        """Potongan tengah pixmap yang, bila di-scale ke ukuran widget, sama dengan KeepAspectRatioByExpanding."""
+        if self._src_rect is None:
+            pw, ph = self.pixmap.width(), self.pixmap.height()
+            scale = max(self.width() / pw, self.height() / ph)
+            sw, sh = self.width() / scale, self.height() / scale
+            self._src_rect = QRectF((pw - sw) / 2, (ph - sh) / 2, sw, sh)
+        return self._src_rect
+
+    def _render_gradient(self) -> QPixmap:
+        px = QPixmap(self.width(), self._FADE_H)
+        px.fill(Qt.GlobalColor.transparent)
+        grad = QLinearGradient(0, 0, 0, self._FADE_H)
+        grad.setColorAt(0, QColor(11, 12, 16, 0))
+        grad.setColorAt(1, QColor(11, 12, 16, 255))
+        p = QPainter(px)
+        p.fillRect(px.rect(), QBrush(grad))
+        p.end()
+        return px
+
     def paintEvent(self, event) -> None:
+        # Hanya area kotor yang digambar ulang (mis. saat overlay monster berubah)
+        dirty = event.rect()
         painter = QPainter(self)
+        painter.setClipRegion(event.region())
         if self.pixmap and not self.pixmap.isNull():
-            scaled = self.pixmap.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
-            crop_x = (scaled.width() - self.width()) // 2
-            crop_y = (scaled.height() - self.height()) // 2
-            painter.drawPixmap(0, 0, scaled, crop_x, crop_y, self.width(), self.height())
+            if self._resizing:
+                # Selama resize: scale langsung oleh painter dari pixmap sumber (tanpa
+                # alokasi pixmap perantara, tanpa smooth filter) — frame ini segera dibuang
+                painter.drawPixmap(QRectF(self.rect()), self.pixmap, self._source_rect())
+            else:
+                # SmoothTransformation mahal — scale sekali per ukuran, repaint berikutnya cukup blit
+                if self._scaled_cache is None or self._scaled_size != self.size():
+                    scaled = self.pixmap.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+                    self._scaled_cache = scaled
+                    self._scaled_size = self.size()
+                    self._crop_offset = QPoint(
+                        (scaled.width() - self.width()) // 2,
+                        (scaled.height() - self.height()) // 2,
+                    )
+                painter.drawPixmap(dirty, self._scaled_cache, dirty.translated(self._crop_offset))
             
         # EFEK DIMMING: Jika sedang combat, tambahkan layer hitam transparan di atas background
         if self._is_combat:
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 140)) # 140/255 kegelapan
+            painter.fillRect(dirty, QColor(0, 0, 0, 140)) # 140/255 kegelapan
             
-        # Fade-out gradient ke arah UI bawah (selalu ada)
-        grad = QLinearGradient(0, self.height() - 80, 0, self.height())
-        grad.setColorAt(0, QColor(11, 12, 16, 0))
-        grad.setColorAt(1, QColor(11, 12, 16, 255))
-        painter.fillRect(self.rect(), QBrush(grad))
+        # Fade-out gradient ke arah UI bawah (selalu ada) — blit dari strip pre-render
+        fade_top = self.height() - self._FADE_H
+        if dirty.bottom() >= fade_top:
+            if self._gradient_px is None:
+                self._gradient_px = self._render_gradient()
+            painter.drawPixmap(0, fade_top, self._gradient_px)
+
+
+def _cached_dim_icon(path: Path, size: int, opacity: float) -> QPixmap | None:
+    """Varian redup dari _cached_icon, juga disimpan di QPixmapCache."""
+    key = f"{path}@{size}~{opacity}"
+    px = QPixmapCache.find(key)
+    if px is None:
+        bright = _cached_icon(path, size)
+        if bright is None: return None
+        px = _dimmed(bright, opacity)
+        QPixmapCache.insert(key, px)
+    return px
+
+
+def _dimmed(px: QPixmap, opacity: float) -> QPixmap:
+    """Salinan pixmap dengan opacity di-bake (pengganti QGraphicsOpacityEffect)."""
+    out = QPixmap(px.size())
+    out.fill(Qt.GlobalColor.transparent)
+    p = QPainter(out)
+    p.setOpacity(opacity)
+    p.drawPixmap(0, 0, px)
+    p.end()
+    return out
+
+
+class SlotsBar(QWidget):
+    """Owner-drawn horizontal row of equipment/bag slot cards with wheel and drag scrolling."""
+
+    _HEIGHT   = 105
+    _CARD_W   = 75
+    _CARD_GAP = 6
+    _PAD_Y    = 4
+    _DIM_OPACITY = 0.2
+    _HANDLE_H    = 4
+    # (fill, border) background kartu per state aktif
+    _CARD_COLORS = {
+        True:  (QColor(212, 175, 55, 20), QColor(ACCENT_COLOR)),
+        False: (QColor(20, 20, 32, 153), QColor("#2a2a3a")),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(self._HEIGHT)
+        self._scroll_x = 0
+        self._card_h = self._HEIGHT - 2 * self._PAD_Y
+        # Drag aktif: (x awal mouse, scroll_x awal, piksel scroll per piksel mouse)
+        self._drag: tuple[float, int, float] | None = None
+
+        # (key, dim pixmap, bright pixmap, label, active, item name)
+        self._slots: list[tuple[str, QPixmap | None, QPixmap | None, str, bool, str]] = []
+        for slot_key, label, icon_file in _ALL_SLOTS:
+            bright = _cached_icon(_ITEM_ICONS_DIR / icon_file, _ITEM_ICON_SIZE)
+            dim    = _cached_dim_icon(_ITEM_ICONS_DIR / icon_file, _ITEM_ICON_SIZE, self._DIM_OPACITY)
+            self._slots.append((slot_key, dim, bright, label, False, ""))
+
+        # Background kartu di-render sekali per (state, device pixel ratio)
+        self._card_px: dict[tuple[bool, float], QPixmap] = {}
+
+        self._font_label = QFont()
+        self._font_label.setFamilies(["Cinzel", "Georgia", "serif"])
+        self._font_label.setPixelSize(9)
+        self._font_name = QFont()
+        self._font_name.setFamilies(["Lora", "Georgia", "serif"])
+        self._font_name.setPixelSize(9)
+
+    def _card(self, active: bool) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        px = self._card_px.get((active, dpr))
+        if px is None:
+            px = self._card_px[active, dpr] = self._render_card(*self._CARD_COLORS[active], dpr)
+        return px
+
+    def _render_card(self, fill: QColor, border: QColor, dpr: float) -> QPixmap:
+        px = QPixmap(ceil(self._CARD_W * dpr), ceil(self._card_h * dpr))
+        px.setDevicePixelRatio(dpr)
+        px.fill(Qt.GlobalColor.transparent)
+        p = QPainter(px)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setBrush(fill)
+        p.setPen(QPen(border, 1))
+        p.drawRoundedRect(QRectF(0.5, 0.5, self._CARD_W - 1, self._card_h - 1), 6, 6)
+        p.end()
+        return px
+
+    def _content_width(self) -> int:
+        n = len(self._slots)
+        return n * self._CARD_W + (n - 1) * self._CARD_GAP
+
+    def _max_scroll(self) -> int:
+        return max(0, self._content_width() - self.width())
+
+    def _handle_geometry(self, max_scroll: int) -> tuple[int, int]:
+        """(x, lebar) scroll handle untuk scroll_x saat ini."""
+        handle_w = max(20, self.width() * self.width() // self._content_width())
+        return (self.width() - handle_w) * self._scroll_x // max_scroll, handle_w
+
+    def _scroll_to(self, x: float) -> None:
+        x = min(self._max_scroll(), max(0, int(x)))
+        if x != self._scroll_x:
+            self._scroll_x = x
+            self.update()
+
+    def set_state(self, state: dict[str, tuple[bool, str]]) -> None:
+        """state: {slot_key: (active, item_name)} — repaint hanya jika ada yang berubah."""
+        new_slots = []
+        for key, dim, bright, label, active, name in self._slots:
+            active, name = state.get(key, (False, ""))
+            new_slots.append((key, dim, bright, label, active, name))
+        if new_slots != self._slots:
+            self._slots = new_slots
+            self.update()
+
+    def wheelEvent(self, event) -> None:
+        max_scroll = self._max_scroll()
+        delta = event.angleDelta().y() or event.angleDelta().x()
+        if not max_scroll or not delta:
+            event.ignore()
+            return
+        self._scroll_to(self._scroll_x - delta // 2)
+        event.accept()
+
+    def mousePressEvent(self, event) -> None:
+        max_scroll = self._max_scroll()
+        if event.button() != Qt.MouseButton.LeftButton or not max_scroll:
+            super().mousePressEvent(event)
+            return
+        x = event.position().x()
+        hx, handle_w = self._handle_geometry(max_scroll)
+        if event.position().y() >= self.height() - 2 * self._HANDLE_H and hx <= x <= hx + handle_w:
+            # Drag handle seperti scrollbar: handle mengikuti mouse
+            ratio = max_scroll / max(1, self.width() - handle_w)
+        else:
+            # Drag kartu: konten mengikuti mouse
+            ratio = -1.0
+        self._drag = (x, self._scroll_x, ratio)
+        event.accept()
+
+    def mouseMoveEvent(self, event) -> None:
+        if self._drag is None:
+            super().mouseMoveEvent(event)
+            return
+        start_x, start_scroll, ratio = self._drag
+        self._scroll_to(start_scroll + (event.position().x() - start_x) * ratio)
+        event.accept()
+
+    def mouseReleaseEvent(self, event) -> None:
+        if self._drag is not None and event.button() == Qt.MouseButton.LeftButton:
+            self._drag = None
+            event.accept()
+        else:
+            super().mouseReleaseEvent(event)
+
+    def resizeEvent(self, event) -> None:
+        self._scroll_x = min(self._scroll_x, self._max_scroll())
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:
+        dirty = event.rect()
+        painter = QPainter(self)
+        w, pad_y, card_h = self._CARD_W, self._PAD_Y, self._card_h
+        x = -self._scroll_x
+        for key, dim, bright, label, active, name in self._slots:
+            # Kartu di luar area kotor (termasuk yang ter-scroll keluar) dilewati
+            if x + w > dirty.left() and x <= dirty.right():
+                painter.drawPixmap(x, pad_y, self._card(active))
+
+                painter.setFont(self._font_label)
+                painter.setPen(QColor(DIM_COLOR))
+                painter.drawText(QRect(x + 4, pad_y + 4, w - 8, 12), _ALIGN_CENTER, label)
+
+                px = bright if active else dim
+                if px:
+                    painter.drawPixmap(
+                        x + (w - px.width()) // 2,
+                        pad_y + 18 + (_ITEM_ICON_SIZE - px.height()) // 2,
+                        px,
+                    )
+
+                if active and name:
+                    painter.setFont(self._font_name)
+                    painter.setPen(QColor(TEXT_COLOR))
+                    painter.drawText(
+                        QRect(x + 4, pad_y + 20 + _ITEM_ICON_SIZE, w - 8, card_h - 26 - _ITEM_ICON_SIZE),
+                        Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+                        name,
+                    )
+            x += w + self._CARD_GAP
+
+        # Scroll handle tipis (pengganti scrollbar QScrollArea)
+        max_scroll = self._max_scroll()
+        if max_scroll:
+            hx, handle_w = self._handle_geometry(max_scroll)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(ACCENT_COLOR))
+            painter.drawRoundedRect(QRectF(hx, self.height() - self._HANDLE_H, handle_w, self._HANDLE_H), 2, 2)
+
+
+# Satu entri label exits ("[NORTH] Cell"), di-bind sekali saat import
+_EXIT_FMT = "[{}] {}".format
+
+
+@lru_cache(maxsize=512)
+def _hp_label(hp: int, max_hp: int) -> str:
+    # Nilai HP sering berulang (pulih penuh, ronde meleset) — string-nya dipakai ulang
+    return f"{hp}/{max_hp} HP"
+
+
+# Stylesheet kartu item ruangan — string yang sama dipakai ulang tiap kartu
+_ITEM_CARD_STYLE = f"QFrame {{ background-color: transparent; border: 1px solid {ACCENT_COLOR}; border-radius: 6px; }}"
+_ITEM_ICON_STYLE = "background: transparent; border: none;"
+_ITEM_NAME_STYLE = "font-size: 9px; color: #c0c0d8; background: transparent; border: none; font-family: 'Lora', serif;"
+
+# Cache label arah exit ("north" -> "NORTH")
+_DIR_LABELS: dict[str, str] = {}
+
+
+# Satu stylesheet untuk seluruh GameView (dipilih lewat objectName), dibangun sekali saat import.
+# Selector turunan (`#uiContainer *`, `#dashboardFrame QFrame`) meniru
+# cascade lama ketika stylesheet dipasang langsung di container.
+_STYLESHEET = (
+    f"QWidget#uiContainer, QWidget#uiContainer * {{ background-color: {BG_COLOR}; }}"
+
+    # lbl_title dihapus, langsung styling judul ruangan
+    f"QLabel#lblRoom {{ font-size: 26px; font-weight: normal; color: #FFFFFF; font-family: {_FONT_TITLE}; }}"
+    f"QLabel#lblNarration {{ font-size: 14px; font-style: italic; color: {TEXT_COLOR}; line-height: 140%; font-family: {_FONT_BODY}; }}"
+
+    f"QLabel#lblExits {{ font-size: 11px; color: {DIM_COLOR}; letter-spacing: 2px; font-family: {_FONT_TITLE}; border-top: 1px solid rgba(212, 175, 55, 0.2); padding-top: 10px; }}"
+    f"QLabel#lblStatus {{ font-size: 13px; color: {STATUS_COLOR}; font-style: italic; font-family: {_FONT_BODY}; }}"
+    # Mode status di-toggle lewat dynamic property "mode" (lihat _set_status_mode)
+    'QLabel#lblStatus[mode="listening"] { color: #00FFCC; }'
+
+    "QFrame#dashboardFrame, QFrame#dashboardFrame QFrame { border-top: 1px solid rgba(255, 255, 255, 0.1); background-color: rgba(15, 16, 20, 0.8); border-radius: 8px; }"
+    f"QFrame#dashboardFrame QLabel#lblPsHp {{ font-size: 16px; font-weight: bold; color: {CRIMSON_RED}; font-family: {_FONT_TITLE}; border: none; background: transparent; }}"
+)
+
+
+# Label teks utama GameView: (atribut, kelas, teks awal, objectName, word wrap).
+# Shadow lbl_room di-gambar langsung oleh _ShadowLabel (tanpa render offscreen + blur)
+_LABELS: tuple[tuple[str, type[QLabel], str, str, bool], ...] = (
+    ("lbl_room",      _ShadowLabel, "—",               "lblRoom",      True),
+    ("lbl_narration", QLabel,       "",                "lblNarration", True),
+    ("lbl_exits",     QLabel,       "Exits: —",        "lblExits",     True),
+    ("lbl_status",    QLabel,       "Initializing...", "lblStatus",    False),
+)
 
 
 class GameView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._slot_cards: dict[str, tuple[QFrame, QLabel, QLabel]] = {}
+        # Key payload terakhir yang sudah di-render — update identik dilewati
+        self._last_state_key: tuple | None = None
+        self._last_items_key: tuple | None = None
+        self._last_status_key: tuple | None = None
+        self._last_hp: tuple[int, int] | None = None
+        # Teks exits per set exit (urutan + nama) — ruangan yang dikunjungi ulang tidak di-format lagi
+        self._exits_cache: dict[tuple, str] = {}
+        self._status_mode = "idle"
+        self._last_status: str | None = None
         self._build_ui()
         self._apply_styles()
 
@@ -219,51 +647,34 @@ class GameView(QWidget):
 
         # ── 2. Bottom Half: UI Container ──
         self._ui_container = QWidget()
+        self._ui_container.setObjectName("uiContainer")
         ui_layout = QVBoxLayout(self._ui_container)
         ui_layout.setContentsMargins(25, 10, 25, 25)
         
-        self.lbl_room = QLabel("—")
-        self.lbl_room.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_room.setWordWrap(True)
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 2)
-        self.lbl_room.setGraphicsEffect(shadow)
-        ui_layout.addWidget(self.lbl_room)
+        for attr, cls, text, obj_name, wrap in _LABELS:
+            lbl = cls(text)
+            lbl.setObjectName(obj_name)
+            lbl.setAlignment(_ALIGN_CENTER)
+            lbl.setWordWrap(wrap)
+            setattr(self, attr, lbl)
+        self.lbl_narration.setMinimumHeight(80)
+        self.lbl_status.setProperty("mode", "idle")
 
+        ui_layout.addWidget(self.lbl_room)
         ui_layout.addSpacing(15)
-
-        # Narration
-        self.lbl_narration = QLabel("")
-        self.lbl_narration.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_narration.setWordWrap(True)
-        self.lbl_narration.setMinimumHeight(80)
         ui_layout.addWidget(self.lbl_narration)
-        
         ui_layout.addStretch()
 
-        # Item Found Rows (Cards format)
-        self._items_row = QWidget()
-        items_h = QHBoxLayout(self._items_row)
-        items_h.setContentsMargins(0, 0, 0, 0)
-        items_h.setSpacing(8)
-        items_h.addStretch()
-        items_h.addStretch() 
-        self._items_layout = items_h
-        self._items_row.setVisible(False)
-        ui_layout.addWidget(self._items_row)
+        # Item Found Rows (Cards format) — dibangun saat item pertama muncul,
+        # cukup ingat posisinya di layout
+        self._ui_layout = ui_layout
+        self._items_row_index = ui_layout.count()
+        self._items_row_widget: QWidget | None = None
 
         ui_layout.addSpacing(15)
 
         # Exits & Mic Status
-        self.lbl_exits = QLabel("Exits: —")
-        self.lbl_exits.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_exits.setWordWrap(True)
         ui_layout.addWidget(self.lbl_exits)
-
-        self.lbl_status = QLabel("Initializing...")
-        self.lbl_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         ui_layout.addWidget(self.lbl_status)
 
         ui_layout.addSpacing(15)
@@ -272,8 +683,22 @@ class GameView(QWidget):
         self._build_dashboard(ui_layout)
         main_layout.addWidget(self._ui_container)
 
+    @property
+    def _items_row(self) -> QWidget:
+        if self._items_row_widget is None:
+            row = QWidget()
+            items_h = QHBoxLayout(row)
+            items_h.setContentsMargins(0, 0, 0, 0)
+            items_h.setSpacing(8)
+            self._items_layout = items_h
+            row.setVisible(False)
+            self._ui_layout.insertWidget(self._items_row_index, row)
+            self._items_row_widget = row
+        return self._items_row_widget
+
     def _build_dashboard(self, parent_layout: QVBoxLayout) -> None:
         self.dashboard_frame = QFrame()
+        self.dashboard_frame.setObjectName("dashboardFrame")
         dash_layout = QVBoxLayout(self.dashboard_frame)
         dash_layout.setContentsMargins(15, 10, 15, 10)
         dash_layout.setSpacing(8)
@@ -284,48 +709,26 @@ class GameView(QWidget):
         hp_h.setContentsMargins(0, 0, 0, 0)
         
         self._icon_heart = QLabel()
-        px = _load_icon("heart.png")
+        px = _heart_pixmap()
         if px: self._icon_heart.setPixmap(px)
         
         self.lbl_ps_hp = QLabel("100/100 HP")
+        self.lbl_ps_hp.setObjectName("lblPsHp")
         hp_h.addWidget(self._icon_heart)
         hp_h.addWidget(self.lbl_ps_hp)
         hp_h.addStretch()
         dash_layout.addWidget(hp_row)
 
-        # Horizontal Scroll Area for Inventory Slots
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            "QScrollBar:horizontal { height: 4px; background: rgba(0,0,0,0.5); border-radius: 2px; }"
-            f"QScrollBar::handle:horizontal {{ background: {ACCENT_COLOR}; border-radius: 2px; }}"
-        )
-        scroll.setFixedHeight(105)
-
-        inner = QWidget()
-        inner.setStyleSheet("background: transparent;")
-        inner_h = QHBoxLayout(inner)
-        inner_h.setContentsMargins(0, 4, 0, 4)
-        inner_h.setSpacing(6)
-
-        for slot_key, label, icon_file in _ALL_SLOTS:
-            card, icon_lbl, name_lbl = self._make_slot_card(label, icon_file)
-            self._slot_cards[slot_key] = (card, icon_lbl, name_lbl)
-            inner_h.addWidget(card)
-        inner_h.addStretch()
-
-        scroll.setWidget(inner)
-        dash_layout.addWidget(scroll)
+        # Inventory Slots (owner-drawn, scroll via wheel)
+        self._slots_bar = SlotsBar()
+        dash_layout.addWidget(self._slots_bar)
 
         parent_layout.addWidget(self.dashboard_frame)
 
     def _make_item_card(self, item: dict) -> QFrame:
         card = QFrame()
         card.setFixedWidth(75)
-        card.setStyleSheet(f"QFrame {{ background-color: transparent; border: 1px solid {ACCENT_COLOR}; border-radius: 6px; }}")
+        card.setStyleSheet(_ITEM_CARD_STYLE)
         v = QVBoxLayout(card)
         v.setContentsMargins(4, 6, 4, 6)
         v.setSpacing(4)
@@ -334,93 +737,90 @@ class GameView(QWidget):
         icon_key  = item.get("slot") or item.get("type", "")
         icon_name = _SLOT_ICON.get(icon_key, "")
         if icon_name:
-            px = QPixmap(str(_ITEM_ICONS_DIR / icon_name))
-            if not px.isNull():
-                px = px.scaled(_ITEM_ICON_SIZE, _ITEM_ICON_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                icon_lbl.setPixmap(px)
-        icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_lbl.setStyleSheet("background: transparent; border: none;")
+            px = _cached_icon(_ITEM_ICONS_DIR / icon_name, _ITEM_ICON_SIZE)
+            if px: icon_lbl.setPixmap(px)
+        icon_lbl.setAlignment(_ALIGN_CENTER)
+        icon_lbl.setStyleSheet(_ITEM_ICON_STYLE)
         v.addWidget(icon_lbl)
 
         name_lbl = QLabel(item["name"])
         name_lbl.setWordWrap(True)
-        name_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_lbl.setStyleSheet("font-size: 9px; color: #c0c0d8; background: transparent; border: none; font-family: 'Lora', serif;")
+        name_lbl.setAlignment(_ALIGN_CENTER)
+        name_lbl.setStyleSheet(_ITEM_NAME_STYLE)
         v.addWidget(name_lbl)
         return card
 
-    def _make_slot_card(self, label: str, icon_file: str) -> tuple[QFrame, QLabel, QLabel]:
-        card = QFrame()
-        card.setFixedWidth(75)
-        card.setStyleSheet("QFrame { background-color: rgba(20, 20, 32, 0.6); border: 1px solid #2a2a3a; border-radius: 6px; }")
-        v = QVBoxLayout(card)
-        v.setContentsMargins(4, 4, 4, 6)
-        v.setSpacing(2)
-
-        slot_lbl = QLabel(label)
-        slot_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        slot_lbl.setStyleSheet(f"font-size: 9px; color: {DIM_COLOR}; background: transparent; border: none; font-family: 'Cinzel', serif;")
-        v.addWidget(slot_lbl)
-
-        icon_lbl = QLabel()
-        px = QPixmap(str(_ITEM_ICONS_DIR / icon_file))
-        if not px.isNull():
-            px = px.scaled(_ITEM_ICON_SIZE, _ITEM_ICON_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            icon_lbl.setPixmap(px)
-        icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_lbl.setStyleSheet("background: transparent; border: none;")
-        
-        effect = QGraphicsOpacityEffect()
-        effect.setOpacity(0.2)
-        icon_lbl.setGraphicsEffect(effect)
-        v.addWidget(icon_lbl)
-
-        name_lbl = QLabel("")
-        name_lbl.setWordWrap(True)
-        name_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_lbl.setStyleSheet("font-size: 9px; color: #444455; background: transparent; border: none; font-family: 'Lora', serif;")
-        v.addWidget(name_lbl)
-
-        return card, icon_lbl, name_lbl
-
     def _apply_styles(self) -> None:
-        self._ui_container.setStyleSheet(f"background-color: {BG_COLOR};")
-        
-        # lbl_title dihapus, langsung styling judul ruangan
-        self.lbl_room.setStyleSheet(f"font-size: 26px; font-weight: normal; color: #FFFFFF; font-family: {_FONT_TITLE};")
-        self.lbl_narration.setStyleSheet(f"font-size: 14px; font-style: italic; color: {TEXT_COLOR}; line-height: 140%; font-family: {_FONT_BODY};")
-        
-        self.lbl_exits.setStyleSheet(f"font-size: 11px; color: {DIM_COLOR}; letter-spacing: 2px; font-family: {_FONT_TITLE}; border-top: 1px solid rgba(212, 175, 55, 0.2); padding-top: 10px;")
-        self.lbl_status.setStyleSheet(f"font-size: 13px; color: {STATUS_COLOR}; font-style: italic; font-family: {_FONT_BODY};")
-
-        self.dashboard_frame.setStyleSheet("QFrame { border-top: 1px solid rgba(255, 255, 255, 0.1); background-color: rgba(15, 16, 20, 0.8); border-radius: 8px; }")
-        self.lbl_ps_hp.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {CRIMSON_RED}; font-family: {_FONT_TITLE}; border: none; background: transparent;")
+        self.setStyleSheet(_STYLESHEET)
 
     # ── Slots ─────────────────────────────────────────────────────────────────
     def update_state(self, payload: dict) -> None:
         room  = payload["room"]
         exits = payload["exits"]
-        self.lbl_room.setText(room["name"])
-        if exits:
-            self.lbl_exits.setText(f"Paths:  " + "  •  ".join(f"[{d.upper()}] {name}" for d, name in exits.items()))
-        else:
-            self.lbl_exits.setText("No Way Out.")
+        key = (room["id"], room["name"], tuple(exits.items()), room.get("bg_image", ""))
+        if key == self._last_state_key:
+            return
+
+        _set_if_changed(self.lbl_room, room["name"])
+        exits_key = key[2]
+        exits_text = self._exits_cache.get(exits_key)
+        if exits_text is None:
+            exits_text = self._format_exits(exits_key)
+            self._exits_cache[exits_key] = exits_text
+        _set_if_changed(self.lbl_exits, exits_text)
             
         if room.get("bg_image", ""):
             self._image_widget.set_image(room["bg_image"])
+        self._last_state_key = key
+
+    @staticmethod
+    def _format_exits(exits: tuple[tuple[str, str], ...]) -> str:
+        if not exits:
+            return "No Way Out."
+        parts = []
+        for d, name in exits:
+            label = _DIR_LABELS.get(d)
+            if label is None:
+                label = _DIR_LABELS[d] = d.upper()
+            parts.append(_EXIT_FMT(label, name))
+        return "Paths:  " + "  •  ".join(parts)
 
     def set_status(self, text: str) -> None:
-        self.lbl_status.setText(text)
+        # Konstanta STATUS_* dari MainWindow datang sebagai objek yang sama
+        if text is self._last_status:
+            return
+        _set_if_changed(self.lbl_status, text)
+        self._last_status = text
         
+    def _set_status_mode(self, mode: str) -> None:
+        # Repolish satu widget terhadap stylesheet root (tanpa parse ulang QSS),
+        # dan hanya saat mode benar-benar berganti
+        if mode == self._status_mode:
+            return
+        self._status_mode = mode
+        self.lbl_status.setProperty("mode", mode)
+        style = self.lbl_status.style()
+        style.unpolish(self.lbl_status)
+        style.polish(self.lbl_status)
+
     def show_listening(self) -> None:
-        self.lbl_status.setText("••• Listening •••")
-        self.lbl_status.setStyleSheet(f"font-size: 13px; color: #00FFCC; font-style: italic; font-family: {_FONT_BODY};")
+        _set_if_changed(self.lbl_status, "••• Listening •••")
+        self._last_status = None
+        self._set_status_mode("listening")
 
     def update_narration(self, text: str) -> None:
-        self.lbl_status.setStyleSheet(f"font-size: 13px; color: {STATUS_COLOR}; font-style: italic; font-family: {_FONT_BODY};")
-        self.lbl_narration.setText(text)
+        self._set_status_mode("idle")
+        _set_if_changed(self.lbl_narration, text)
 
     def update_room_items(self, items: list[dict]) -> None:
+        key = tuple((i.get("id"), i["name"]) for i in items)
+        if key == self._last_items_key:
+            return
+        if not items and self._items_row_widget is None:
+            self._last_items_key = key
+            return
+
+        row = self._items_row
         while self._items_layout.count() > 0:
             child = self._items_layout.takeAt(0)
             if child.widget(): child.widget().deleteLater()
@@ -430,9 +830,10 @@ class GameView(QWidget):
             for item in items:
                 self._items_layout.addWidget(self._make_item_card(item))
             self._items_layout.addStretch()
-            self._items_row.setVisible(True)
+            row.setVisible(True)
         else:
-            self._items_row.setVisible(False)
+            row.setVisible(False)
+        self._last_items_key = key
 
     def show_monster_row(self, name: str, hp: int, max_hp: int) -> None:
         # Alih-alih di bawah, sekarang kita tembak ke overlay di gambar!
@@ -444,31 +845,35 @@ class GameView(QWidget):
 
     # ── Dashboard Slots ──
     def update_player_hp(self, hp: int, max_hp: int) -> None:
-        self.lbl_ps_hp.setText(f"{hp}/{max_hp} HP")
+        if (hp, max_hp) == self._last_hp:
+            return
+        _set_if_changed(self.lbl_ps_hp, _hp_label(hp, max_hp))
+        self._last_hp = (hp, max_hp)
 
     def update_player_status(self, payload: dict) -> None:
         equipped = payload.get("equipped", {})
         bag      = payload.get("bag", [])
-
-        for slot_key, (card, icon_lbl, name_lbl) in self._slot_cards.items():
+        key = (
+            tuple((slot, item.get("id") if item else None) for slot, item in equipped.items()),
+            tuple((i.get("id"), i.get("type")) for i in bag),
+        )
+        if key == self._last_status_key:
+            return
+
+        # Tangan kosong tidak dihitung sebagai senjata terpasang
+        equipped_view = dict(equipped)
+        w = equipped_view.get("weapon")
+        if w and w.get("id") == "bare_hands":
+            equipped_view["weapon"] = None
+        bag_types = {i.get("type"): i for i in reversed(bag) if i.get("type") in ("key", "potion")}
+
+        state: dict[str, tuple[bool, str]] = {}
+        for slot_key, _label, _icon in _ALL_SLOTS:
             if slot_key in ("key", "potion"):
-                match = next((i for i in bag if i.get("type") == slot_key), None)
-                active    = match is not None
-                item_name = match["name"] if match else ""
+                item = bag_types.get(slot_key)
             else:
-                item = equipped.get(slot_key)
-                if slot_key == "weapon" and item and item.get("id") == "bare_hands":
-                    active, item_name = False, ""
-                else:
-                    active, item_name = item is not None, item["name"] if item else ""
-
-            if active:
-                card.setStyleSheet(f"QFrame {{ background-color: rgba(212, 175, 55, 0.08); border: 1px solid {ACCENT_COLOR}; border-radius: 6px; }}")
-                icon_lbl.graphicsEffect().setOpacity(1.0)
-                name_lbl.setText(item_name)
-                name_lbl.setStyleSheet(f"font-size: 9px; color: {TEXT_COLOR}; background: transparent; border: none; font-family: 'Lora', serif;")
-            else:
-                card.setStyleSheet("QFrame { background-color: rgba(20, 20, 32, 0.6); border: 1px solid #2a2a3a; border-radius: 6px; }")
-                icon_lbl.graphicsEffect().setOpacity(0.2)
-                name_lbl.setText("")
-                name_lbl.setStyleSheet("font-size: 9px; color: #444455; background: transparent; border: none;")
\ No newline at end of file
+                item = equipped_view.get(slot_key)
+            state[slot_key] = (item is not None, item["name"] if item else "")
+
+        self._slots_bar.set_state(state)
+        self._last_status_key = key
@@ -1,12 +1,27 @@
 import logging
+import sys
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QMainWindow, QMessageBox, QVBoxLayout, QWidget
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
 
 from config import BG_COLOR, TEXT_COLOR
 from ui.game_view import GameView
-from ui.signals import AppSignals
+from ui.signals import AppSignals, PlayerHP
+
+# Teks status dipakai ulang sebagai objek yang sama, jadi GameView.set_status
+# bisa melewati update lewat cek identitas. Literal berspasi tidak otomatis
+# di-intern Python, jadi di-intern eksplisit agar salinan dari modul lain pun identik
+STATUS_READY      = sys.intern("Ready  —  Hold [SPACE] to speak")
+STATUS_NARRATING  = sys.intern("Narrating...")
+STATUS_PROCESSING = sys.intern("Processing...")
+STATUS_COMBAT     = sys.intern("IN COMBAT  —  Hold [SPACE] to attack")
+STATUS_WON        = sys.intern("YOU ESCAPED THE DUNGEON!")
+STATUS_DIED       = sys.intern("YOU DIED")
+
+# Release Space baru menutup mic setelah 50ms; press yang datang sebelumnya
+# berarti release tadi bounce / auto-repeat yang salah dilaporkan (GTK/X11)
+_KEY_DEBOUNCE_MS = 50
 
 class MainWindow(QMainWindow):
     """
@@ -14,20 +29,37 @@ class MainWindow(QMainWindow):
     MapPanel has been completely removed to focus on the cinematic UI.
     """
 
+    # Menggunakan fallback font Lora/Georgia; di-format sekali saat import
+    _STYLESHEET = f"background-color: {BG_COLOR}; color: {TEXT_COLOR}; font-family: 'Lora', 'Georgia', serif;"
+
+    _SPACE = Qt.Key.Key_Space.value   # int polos; event.key() juga mengembalikan int
+    _ICON: QIcon | None = None
+
+    @classmethod
+    def _get_icon(cls) -> QIcon:
+        # QIcon file-based baru decode PNG saat pertama di-render; instance-nya dipakai ulang
+        if cls._ICON is None:
+            cls._ICON = QIcon("assets/icons/VoD_icon.png")
+        return cls._ICON
+
     def __init__(self, signals: AppSignals, controller):
         super().__init__()
         self._signals    = signals
         self._controller = controller
         self._recording  = False
+        self._stop_timer = QTimer(self)   # stop recording tertunda, lihat keyReleaseEvent
+        self._stop_timer.setSingleShot(True)
+        self._stop_timer.setInterval(_KEY_DEBOUNCE_MS)
+        self._stop_timer.timeout.connect(self._stop_recording)
+        self._reset_pending = False
 
         self.setWindowTitle("Voice of the Dungeon")
-        self.setWindowIcon(QIcon("assets/icons/VoD_icon.png"))
+        self.setWindowIcon(self._get_icon())
         # Format Portrait: Lebar 480px, Tinggi 850px
         self.setMinimumSize(520, 900)
         self.resize(480, 850)
         
-        # Menggunakan fallback font Lora/Georgia
-        self.setStyleSheet(f"background-color: {BG_COLOR}; color: {TEXT_COLOR}; font-family: 'Lora', 'Georgia', serif;")
+        self.setStyleSheet(self._STYLESHEET)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -39,7 +71,13 @@ class MainWindow(QMainWindow):
         layout.addWidget(self._game_view)
 
         self._connect_signals()
+        QApplication.instance().aboutToQuit.connect(self._reset_after_close)
+
+        # Fokus diambil setelah tick pertama event loop, saat window sudah tampil
+        QTimer.singleShot(0, self._grab_focus)
 
+    @pyqtSlot()
+    def _grab_focus(self) -> None:
         self.setFocus()
         self.activateWindow()
 
@@ -48,12 +86,12 @@ class MainWindow(QMainWindow):
     def _connect_signals(self) -> None:
         self._signals.state_updated.connect(self._on_state_updated)
 
-        self._signals.narration_started.connect(lambda: self._game_view.set_status("Narrating..."))
+        self._signals.narration_started.connect(self._status_narrating)
         self._signals.narration_text.connect(self._game_view.update_narration)
-        self._signals.narration_finished.connect(lambda: self._game_view.set_status("Ready  —  Hold [SPACE] to speak"))
+        self._signals.narration_finished.connect(self._status_ready)
         self._signals.listening_started.connect(self._game_view.show_listening)
-        self._signals.processing_started.connect(lambda: self._game_view.set_status("Processing..."))
-        self._signals.processing_finished.connect(lambda: self._game_view.set_status("Ready  —  Hold [SPACE] to speak"))
+        self._signals.processing_started.connect(self._status_processing)
+        self._signals.processing_finished.connect(self._status_ready)
         self._signals.error_occurred.connect(self._on_error)
         self._signals.game_won.connect(self._on_game_won)
         self._signals.game_over.connect(self._on_game_over)
@@ -68,11 +106,26 @@ class MainWindow(QMainWindow):
     # ── Key events (hold-to-talk) ─────────────────────────────────────────────
 
     def closeEvent(self, event) -> None:
-        self._controller.reset_game_state()
+        # Reset (tulis file state) dijalankan setelah window tertutup. aboutToQuit
+        # jadi jaring pengaman bila event loop berhenti sebelum timer 0ms jalan
+        self._reset_pending = True
+        QTimer.singleShot(0, self._reset_after_close)
         super().closeEvent(event)
 
+    @pyqtSlot()
+    def _reset_after_close(self) -> None:
+        if not self._reset_pending:
+            return
+        self._reset_pending = False
+        self._controller.reset_game_state()
+
     def keyPressEvent(self, event) -> None:
-        if event.key() == Qt.Key.Key_Space and not event.isAutoRepeat() and not self._recording:
+        k   = event.key()
+        rep = event.isAutoRepeat()
+        if k == self._SPACE and not rep and self._stop_timer.isActive():
+            # Release barusan palsu — mic tetap terbuka
+            self._stop_timer.stop()
+        elif k == self._SPACE and not rep and not self._recording:
             self._recording = True
             self._game_view.show_listening()
             self._controller.on_recording_started()
@@ -80,40 +133,76 @@ class MainWindow(QMainWindow):
             super().keyPressEvent(event)
 
     def keyReleaseEvent(self, event) -> None:
-        if event.key() == Qt.Key.Key_Space and not event.isAutoRepeat() and self._recording:
-            self._recording = False
-            self._controller.on_recording_stopped()
+        if event.key() == self._SPACE and not event.isAutoRepeat() and self._recording:
+            self._stop_timer.start()
         else:
             super().keyReleaseEvent(event)
 
+    @pyqtSlot()
+    def _stop_recording(self) -> None:
+        self._recording = False
+        self._controller.on_recording_stopped()
+
     # ── Signal slots ──────────────────────────────────────────────────────────
 
+    @pyqtSlot()
+    def _status_narrating(self) -> None:
+        self._game_view.set_status(STATUS_NARRATING)
+
+    @pyqtSlot()
+    def _status_processing(self) -> None:
+        self._game_view.set_status(STATUS_PROCESSING)
+
+    @pyqtSlot()
+    def _status_ready(self) -> None:
+        self._game_view.set_status(STATUS_READY)
+
+    @pyqtSlot(str)
     def _on_error(self, message: str) -> None:
         logging.warning(f"MainWindow: error — {message}")
         self._game_view.set_status(f"⚠  {message}")
 
+    @pyqtSlot(str, str)
     def _on_game_won(self, room_name: str, wav_path: str) -> None:
-        self._game_view.set_status("YOU ESCAPED THE DUNGEON!")
-        QMessageBox.information(self, "Victory!", f"You reached {room_name}.\n\nYou escaped the dungeon.\n\n(Close to play again.)")
-        self._controller.restart_after_death()
-
+        from PyQt6.QtWidgets import QMessageBox  # hanya dipakai di akhir permainan
+        self._game_view.set_status(STATUS_WON)
+        self._open_end_dialog(QMessageBox(
+            QMessageBox.Icon.Information, "Victory!",
+            f"You reached {room_name}.\n\nYou escaped the dungeon.\n\n(Close to play again.)", parent=self,
+        ))
+
+    @pyqtSlot(str, str)
     def _on_game_over(self, narration_text: str, wav_path: str) -> None:
-        self._game_view.set_status("YOU DIED")
-        QMessageBox.critical(self, "Game Over", f"{narration_text}\n\n(Close to play again.)")
+        from PyQt6.QtWidgets import QMessageBox  # hanya dipakai di akhir permainan
+        self._game_view.set_status(STATUS_DIED)
+        self._open_end_dialog(QMessageBox(
+            QMessageBox.Icon.Critical, "Game Over", f"{narration_text}\n\n(Close to play again.)", parent=self,
+        ))
+
+    def _open_end_dialog(self, box) -> None:
+        # open() tidak memutar nested event loop seperti information()/critical();
+        # restart baru jalan saat dialog ditutup
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(self._on_end_dialog_finished)
+        box.open()
+
+    @pyqtSlot()
+    def _on_end_dialog_finished(self) -> None:
         self._controller.restart_after_death()
 
-    def _on_state_updated(self, payload: dict) -> None:
+    @pyqtSlot(object, object)
+    def _on_state_updated(self, payload: dict, player_hp: PlayerHP) -> None:
         self._game_view.update_state(payload)
-        player = payload.get("player", {})
-        self._game_view.update_player_hp(player.get("hp", 0), player.get("max_hp", 0))
+        self._game_view.update_player_hp(player_hp.hp, player_hp.max_hp)
 
+    @pyqtSlot(object)
     def _on_combat_started(self, payload: dict) -> None:
         self._game_view.show_monster_row(payload["name"], payload["enemy_hp"], payload["enemy_max_hp"])
         self._game_view.update_player_hp(payload["player_hp"], payload["player_max_hp"])
-        self._game_view.set_status("IN COMBAT  —  Hold [SPACE] to attack")
+        self._game_view.set_status(STATUS_COMBAT)
 
+    @pyqtSlot(object)
     def _on_combat_updated(self, payload: dict) -> None:
-        enemy = self._controller._current_enemy
-        enemy_name = enemy["name"] if enemy else "Enemy"
+        enemy_name = payload.get("name") or "Enemy"
         self._game_view.show_monster_row(enemy_name, payload["enemy_hp"], payload["enemy_max_hp"])
         self._game_view.update_player_hp(payload["player_hp"], payload["player_max_hp"])
\ No newline at end of file
@@ -4,24 +4,27 @@ ui/map_panel.py — Phase 3.2  Live Dungeon Map Panel
 A collapsible QGraphicsView-based side panel showing the dungeon graph.
 Connected to AppSignals.map_state_changed for live updates.
 
-Scene is built once (_build_scene). On each update_map() call only
-the pen/brush and HTML text of existing items are mutated — no rebuild.
+Scene is built once (_build_scene). Each node (rect + label) is one
+QGraphicsPixmapItem; on update_map() only changed nodes get a new pixmap,
+rendered once per (style, label) and reused from a cache afterwards.
+Label lines are word-wrapped and centred manually (no rich-text parsing).
 
 Z-order:
-  0 — edge lines (behind nodes)
-  1 — node background rects
-  2 — node text items
+  0 — edge path (behind nodes)
+  1 — node pixmaps
 """
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QBrush, QColor, QPen, QPixmap
+from functools import cache, lru_cache
+from math import ceil
+
+from PyQt6.QtCore import QPointF, QRectF, Qt, QTimer
+from PyQt6.QtGui import QBrush, QColor, QFont, QFontMetricsF, QPainter, QPainterPath, QPen, QPixmap
 from PyQt6.QtWidgets import (
     QCheckBox,
     QFrame,
-    QGraphicsLineItem,
-    QGraphicsRectItem,
+    QGraphicsItem,
+    QGraphicsPixmapItem,
     QGraphicsScene,
-    QGraphicsTextItem,
     QGraphicsView,
     QHBoxLayout,
     QLabel,
@@ -34,6 +37,7 @@ from config import (
     ASSETS_DIR, BG_COLOR, TEXT_COLOR, ACCENT_COLOR, DIM_COLOR,
     CRIMSON_RED, BOSS_ALIVE_COLOR, MONSTER_COLOR, ITEM_COLOR, FONT_BODY
 )
+from ui.signals import MapState, PlayerHP, RoomView
 
 _ICONS_DIR  = ASSETS_DIR / "icons"
 _ICON_SIZE  = 28   # px for Player Status icons
@@ -72,6 +76,11 @@ _EDGES: list[tuple[str, str]] = [
     ("c",    "t"),  ("d",    "t"),
 ]
 
+# Koordinat (x1, y1, x2, y2) tiap edge, di-resolve sekali saat import
+_EDGE_LINES: tuple[tuple[int, int, int, int], ...] = tuple(
+    (*_NODE_CENTERS[r1], *_NODE_CENTERS[r2]) for r1, r2 in _EDGES
+)
+
 # Room metadata (mirrors dungeon_map.json — static dungeon)
 _ROOM_TYPES: dict[str, str] = {
     "home": "home",
@@ -117,7 +126,147 @@ _TYPE_FILL = {
     "exit":   "#0A1A10",
 }
 
+_FILL_FALLBACK = "#2a2a3a"
+
+# QBrush / QPen dibuat sekali per warna (dan lebar) — update_map hanya memilih
+_BRUSH_CACHE: dict[str, QBrush] = {
+    c: QBrush(QColor(c)) for c in (
+        *_TYPE_FILL.values(), _COL_FILL_DEAD, _FILL_FALLBACK,
+    )
+}
+
+
+def _make_pen(color: str, width: int) -> QPen:
+    pen = QPen(QColor(color))
+    pen.setWidth(width)
+    return pen
+
+
+_PEN_CACHE: dict[tuple[str, int], QPen] = {
+    key: _make_pen(*key) for key in (
+        (_COL_BORDER_PLAY, 3),
+        (_COL_BORDER_LOCK, 2),
+        (_COL_BORDER_BOSS, 2),
+        (_COL_BORDER_NORM, 1),
+        (_COL_EDGE,        1),
+        # Warna teks label (QPainter.drawText memakai pen)
+        (_COL_NAME, 1), (_COL_NAME_DIM, 1), (_COL_BOSS_ALIVE, 1),
+        (_COL_MONSTER, 1), (_COL_ITEM, 1),
+    )
+}
+
+_ARMOR_SLOTS = ("helmet", "suit", "legs", "shoes", "cloak", "shield")
+_ARMOR_PREFIXES = tuple((s, s.title() + ": ") for s in _ARMOR_SLOTS)   # (slot, "Helmet: ")
+
+_EMPTY_ROOM = RoomView((), (), None, False, False)   # ruangan yang tidak ada di payload
+
+# Gaya baris label node: (pixel size, bold, warna)
+_LINE_TITLE      = (11, True,  _COL_NAME)
+_LINE_TITLE_DIM  = (11, True,  _COL_NAME_DIM)
+_LINE_BOSS_ALIVE = (10, True,  _COL_BOSS_ALIVE)
+_LINE_BOSS_DEAD  = (9,  False, _COL_NAME_DIM)
+_LINE_MONSTER    = (9,  False, _COL_MONSTER)
+_LINE_ITEM       = (9,  False, _COL_ITEM)
+
+# Pixmap node lebih besar _NODE_MARGIN tiap sisi: border 3px menonjol 1.5px keluar rect
+_NODE_MARGIN = 2
+_NODE_PIXMAP_CACHE_MAX = 256   # (style, label, dpr) unik; dikosongkan bila penuh
+
+# Area teks label di dalam rect node (inset 8px kiri-kanan, 6px atas)
+_LABEL_INSET_X = 8
+_LABEL_INSET_Y = 6
+_LABEL_W       = NODE_W - 2 * _LABEL_INSET_X
+
+
+@cache
+def _boss_dead_text(boss_name: str) -> str:
+    return f"{boss_name} [dead]"
+
+
+@cache
+def _line_font(size: int | None, bold: bool) -> QFont:
+    font = QFont()
+    font.setFamilies([FONT_BODY, "serif"])
+    if size is not None:
+        font.setPixelSize(size)
+    font.setBold(bold)
+    return font
+
+
+@cache
+def _ascent_descent(size: int | None, bold: bool) -> tuple[float, float]:
+    fm = QFontMetricsF(_line_font(size, bold))
+    return fm.ascent(), fm.descent()
+
+
+@cache
+def _wrap(text: str, size: int, bold: bool) -> tuple[tuple[str, float], ...]:
+    """Word-wrap satu baris label ke _LABEL_W; hasil (teks, lebar) per baris visual."""
+    fm = QFontMetricsF(_line_font(size, bold))
+    lines: list[tuple[str, float]] = []
+    current = ""
+    for word in text.split(" "):
+        candidate = f"{current} {word}" if current else word
+        if current and fm.horizontalAdvance(candidate) > _LABEL_W:
+            lines.append((current, fm.horizontalAdvance(current)))
+            current = word
+        else:
+            current = candidate
+    lines.append((current, fm.horizontalAdvance(current)))
+    return tuple(lines)
+
+
+def _layout_label(lines: tuple[tuple[str, tuple], ...]) -> tuple[list[tuple[str, QFont, str, float, float]], float]:
+    """Posisi baris label relatif ke area teks: ([(teks, font, warna, x, baseline)], tinggi total)."""
+    # Baris yang diakhiri pemisah baris ikut tinggi font default (seperti <br> di rich text)
+    br_ascent, br_descent = _ascent_descent(None, False)
+    last = len(lines) - 1
+    runs = []
+    y = 0.0
+    for idx, (text, (size, bold, color)) in enumerate(lines):
+        font = _line_font(size, bold)
+        ascent, descent = _ascent_descent(size, bold)
+        wrapped = _wrap(text, size, bold)
+        for sub, (line, width) in enumerate(wrapped):
+            if idx != last and sub == len(wrapped) - 1:
+                line_ascent, line_descent = max(ascent, br_ascent), max(descent, br_descent)
+            else:
+                line_ascent, line_descent = ascent, descent
+            runs.append((line, font, color, (_LABEL_W - width) / 2, y + line_ascent))
+            y += line_ascent + line_descent
+    return runs, y
+
+
+def _render_node(fill: str, pen_key: tuple[str, int], lines: tuple[tuple[str, tuple], ...], dpr: float) -> QPixmap:
+    """Raster rect + label satu node; origin pixmap = pojok rect dikurangi _NODE_MARGIN."""
+    runs, label_h = _layout_label(lines)
+    m = _NODE_MARGIN
+    w = NODE_W + 2 * m
+    h = max(NODE_H, _LABEL_INSET_Y + ceil(label_h)) + 2 * m
+    px = QPixmap(ceil(w * dpr), ceil(h * dpr))
+    px.setDevicePixelRatio(dpr)
+    px.fill(Qt.GlobalColor.transparent)
+    p = QPainter(px)
+    p.setPen(_PEN_CACHE[pen_key])
+    p.setBrush(_BRUSH_CACHE[fill])
+    p.drawRect(QRectF(m, m, NODE_W, NODE_H))
+    ox, oy = m + _LABEL_INSET_X, m + _LABEL_INSET_Y
+    for text, font, color, x, baseline in runs:
+        p.setFont(font)
+        p.setPen(_PEN_CACHE[color, 1])
+        p.drawText(QPointF(ox + x, oy + baseline), text)
+    p.end()
+    return px
+
+
+# Template teks Player Status, di-bind sekali saat import
+_HP_FMT     = "{}/{}".format
+_WEAPON_FMT = "Weapon: {}  (ATK {})".format
+_ARMOR_FMT  = "{}{} (DEF {})".format
+
+@lru_cache(maxsize=32)
 def _load_icon(name: str) -> QPixmap | None:
+    # Satu decode + smooth scale per file; QPixmap implicitly shared antar QLabel
     px = QPixmap(str(_ICONS_DIR / name))
     if px.isNull():
         return None
@@ -133,21 +282,9 @@ class MapPanel(QWidget):
     Right-side collapsible panel displaying the dungeon graph.
 
     Slot:
-        update_map(payload: dict)  — connected to AppSignals.map_state_changed
-
-    Payload schema:
-        {
-          "player_room": str,
-          "rooms": {
-            room_id: {
-              "items":        [str, ...],   # item display names
-              "monsters":     [str, ...],   # monster display names
-              "boss":         str | None,   # boss display name
-              "boss_cleared": bool,
-              "locked":       bool,
-            }
-          }
-        }
+        update_map(state: MapState)  — connected to AppSignals.map_state_changed
+
+    Payload: ui.signals.MapState(player_room, rooms={room_id: RoomView})
     """
 
     def __init__(self, parent=None):
@@ -156,8 +293,30 @@ class MapPanel(QWidget):
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
         self.setStyleSheet(f"background-color: {BG_COLOR};")
 
-        # room_id → {"rect": QGraphicsRectItem, "text": QGraphicsTextItem}
+        # room_id → {"item": QGraphicsPixmapItem, "title_lines": {(locked, dim): line}, "is_boss_room": bool, "fill": str,
+        #            "style": (fill, pen_key), "label": ((text, line style), ...),
+        #            "appearance_key": tuple | None, "label_key": tuple | None,
+        #            "room": RoomView | None  (snapshot terakhir yang diterapkan)}
         self._node_items: dict[str, dict] = {}
+        # Urutan iterasi update_map, dibekukan sekali setelah _build_scene
+        self._nodes: tuple[tuple[str, dict], ...] = ()
+        # (style, label, dpr) → QPixmap node yang sudah di-raster
+        self._node_pixmaps: dict[tuple, QPixmap] = {}
+
+        # Snapshot per ruangan ada di node["room"]; di sini hanya posisi player
+        self._last_player_room: str | None = None
+        self._pending_payload: MapState | None = None   # payload yang belum digambar
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_update)
+
+        # Armor terakhir yang ditampilkan — inventory identik tidak membangun ulang teks
+        self._last_armor_key: tuple | None = None
+        # Teks label status terakhir — setText dilewati bila sama
+        self._last_hp_text = "100/100"
+        self._last_weapon_text = "Weapon: [none]"
+        self._last_bag_text = ""
 
         self._build_ui()
         self._build_scene()
@@ -181,8 +340,18 @@ class MapPanel(QWidget):
         # Graphics scene + view
         self._scene = QGraphicsScene(0, 0, SCENE_W, SCENE_H)
         self._scene.setBackgroundBrush(QBrush(QColor(BG_COLOR)))
+        # ~25 item statis: BSP index hanya overhead
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
 
         self._view = QGraphicsView(self._scene)
+        # Scene kecil yang hampir selalu berubah di beberapa node sekaligus —
+        # gambar ulang seluruh viewport lebih murah daripada menghitung dirty region
+        self._view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self._view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self._view.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        # Isinya hanya rect dan garis lurus 1px — antialiasing cuma memperlambat.
+        # Teks label di-raster sendiri di _render_node, tidak terpengaruh hint view
+        self._view.setRenderHints(QPainter.RenderHint(0))
         self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._view.setStyleSheet(f"background-color: {BG_COLOR}; border: none;")
@@ -199,7 +368,7 @@ class MapPanel(QWidget):
         self._toggle_cb.setStyleSheet(
             f"font-size: 12px; color: {_COL_NAME_DIM}; padding: 2px;"
         )
-        self._toggle_cb.toggled.connect(self._view.setVisible)
+        self._toggle_cb.toggled.connect(self._on_toggled)
         bottom.addWidget(self._toggle_cb)
         bottom.addStretch()
         outer.addLayout(bottom)
@@ -210,98 +379,155 @@ class MapPanel(QWidget):
     # ── Scene construction ─────────────────────────────────────────────────────
 
     def _build_scene(self) -> None:
-        """Draw static edges then create persistent node items with placeholder text."""
-        edge_pen = QPen(QColor(_COL_EDGE))
-        edge_pen.setWidth(1)
-
-        for r1, r2 in _EDGES:
-            cx1, cy1 = _NODE_CENTERS[r1]
-            cx2, cy2 = _NODE_CENTERS[r2]
-            line = QGraphicsLineItem(cx1, cy1, cx2, cy2)
-            line.setPen(edge_pen)
-            line.setZValue(0)
-            self._scene.addItem(line)
+        """Draw static edges then create one persistent pixmap item per node."""
+        edge_pen = _PEN_CACHE[_COL_EDGE, 1]
+
+        # Semua edge dalam satu path — satu item, satu drawPath per repaint
+        path = QPainterPath()
+        for cx1, cy1, cx2, cy2 in _EDGE_LINES:
+            path.moveTo(cx1, cy1)
+            path.lineTo(cx2, cy2)
+        edges = self._scene.addPath(path, edge_pen)
+        edges.setZValue(0)
+        # Path statis yang tergambar ulang tiap FullViewportUpdate — blit dari cache
+        edges.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         for room_id, (nx, ny) in _NODE_RECTS.items():
-            fill = _TYPE_FILL.get(_ROOM_TYPES[room_id], "#2a2a3a")
-
-            rect_item = QGraphicsRectItem(nx, ny, NODE_W, NODE_H)
-            rect_item.setBrush(QBrush(QColor(fill)))
-            rect_item.setPen(QPen(QColor(_COL_BORDER_NORM)))
-            rect_item.setZValue(1)
-            self._scene.addItem(rect_item)
-
-            text_item = QGraphicsTextItem()
-            text_item.setPos(nx + 4, ny + 2)
-            text_item.setTextWidth(NODE_W - 8)
-            text_item.setZValue(2)
-            text_item.setHtml(
-                f'<span style="font-size:10px; font-weight:bold; color:{_COL_NAME};">'
-                f"{_ROOM_NAMES[room_id]}</span>"
-            )
-            self._scene.addItem(text_item)
+            room_type = _ROOM_TYPES.get(room_id, "normal")
+            fill = _TYPE_FILL.get(room_type, _FILL_FALLBACK)
+
+            # Rect + label satu node di-raster jadi satu pixmap (lihat _refresh_node)
+            item = QGraphicsPixmapItem()
+            item.setPos(nx - _NODE_MARGIN, ny - _NODE_MARGIN)
+            item.setZValue(1)
+            self._scene.addItem(item)
+
+            # Konstanta per ruangan disimpan di record node — hot path tidak
+            # lagi lookup ke dict modul
+            name = _ROOM_NAMES[room_id]
+            # Baris judul siap pakai per (is_locked, boss_cleared)
+            title_lines = {
+                (locked, dim): (f"{name} 🔒" if locked else name, _LINE_TITLE_DIM if dim else _LINE_TITLE)
+                for locked in (False, True) for dim in (False, True)
+            }
+            node = self._node_items[room_id] = {
+                "item": item, "title_lines": title_lines,
+                "is_boss_room": room_type == "boss", "fill": fill,
+                "style": (fill, (_COL_BORDER_NORM, 1)), "label": (title_lines[False, False],),
+                "appearance_key": None, "label_key": None, "room": None,
+            }
+            self._refresh_node(node)
 
-            self._node_items[room_id] = {"rect": rect_item, "text": text_item}
+        self._nodes = tuple(self._node_items.items())
 
     # ── Public slot ────────────────────────────────────────────────────────────
 
-    def update_map(self, payload: dict) -> None:
-        """Redraw node borders and text to reflect current game state."""
-        player_room = payload.get("player_room", "")
-        rooms_data  = payload.get("rooms", {})
-
-        for room_id, node in self._node_items.items():
-            info         = rooms_data.get(room_id, {})
-            room_type    = _ROOM_TYPES.get(room_id, "normal")
-            is_player    = room_id == player_room
-            is_locked    = info.get("locked", False)
-            boss_name    = info.get("boss")
-            boss_cleared = info.get("boss_cleared", False)
-            items_list   = info.get("items", [])
-            monsters     = info.get("monsters", [])
-
-            self._update_appearance(
-                node["rect"], room_type, is_player, is_locked, boss_name, boss_cleared
+    def update_map(self, payload: MapState) -> None:
+        """Queue a redraw of node borders and text to reflect current game state."""
+        # Burst emit dalam satu iterasi event loop → hanya payload terakhir yang digambar.
+        # Map disembunyikan lewat checkbox: payload ditahan sampai tampil lagi.
+        self._pending_payload = payload
+        if not self._view.isHidden() and not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_update(self) -> None:
+        payload, self._pending_payload = self._pending_payload, None
+        if payload is None:
+            return
+        if self._view.isHidden():
+            self._pending_payload = payload
+            return
+        player_room, rooms_data = payload
+        get_room    = rooms_data.get
+        moved       = (self._last_player_room, player_room) if player_room != self._last_player_room else ()
+
+        # Payload selalu snapshot baru dari controller: bandingkan isi, bukan identitas.
+        # Ruangan yang isinya sama dan tidak terlibat perpindahan player dilewati.
+        changed = []
+        for room_id, node in self._nodes:
+            info = get_room(room_id, _EMPTY_ROOM)
+            if info != node["room"] or room_id in moved:
+                node["room"] = info
+                changed.append((node, info, room_id == player_room))
+        self._last_player_room = player_room
+        if not changed:
+            return
+
+        # Semua setPixmap digabung jadi satu repaint viewport; sinyal changed scene
+        # per item tidak perlu karena viewport di-update penuh di akhir
+        self._view.setUpdatesEnabled(False)
+        self._scene.blockSignals(True)
+        try:
+            for node, info, is_player in changed:
+                self._apply_room(node, info, is_player)
+        finally:
+            self._scene.blockSignals(False)
+            self._view.setUpdatesEnabled(True)
+            self._view.viewport().update()
+
+    def _apply_room(self, node: dict, info: RoomView, is_player: bool) -> None:
+        """Terapkan state satu ruangan ke rect + label node-nya."""
+        items_list, monsters, boss_name, boss_cleared, is_locked = info
+
+        # Node yang state-nya tidak berubah dilewati
+        dirty = False
+        appearance_key = (is_player, is_locked, bool(boss_name), boss_cleared)
+        if appearance_key != node["appearance_key"]:
+            dirty = self._update_appearance(
+                node, is_player, is_locked, boss_name, boss_cleared
             )
-            node["text"].setHtml(
-                self._build_html(
-                    room_id, is_locked, boss_name, boss_cleared,
-                    items_list, monsters
-                )
+            node["appearance_key"] = appearance_key
+
+        label_key = (is_locked, boss_name, boss_cleared, items_list[:2], monsters)
+        if label_key != node["label_key"]:
+            node["label"] = self._label_lines(
+                node["title_lines"][is_locked, boss_cleared], boss_name, boss_cleared,
+                items_list, monsters
             )
+            node["label_key"] = label_key
+            dirty = True
+
+        if dirty:
+            self._refresh_node(node)
+
+    def _on_toggled(self, checked: bool) -> None:
+        self._view.setVisible(checked)
+        if checked:
+            self._update_timer.stop()
+            self._flush_update()
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
     def _update_appearance(
         self,
-        rect: QGraphicsRectItem,
-        room_type: str,
+        node: dict,
         is_player: bool,
         is_locked: bool,
         boss_name: str | None,
         boss_cleared: bool,
-    ) -> None:
-        fill = _COL_FILL_DEAD if (room_type == "boss" and boss_cleared) \
-               else _TYPE_FILL.get(room_type, "#2a2a3a")
-        rect.setBrush(QBrush(QColor(fill)))
+    ) -> bool:
+        """Pilih fill + pen node; True bila berbeda dari yang sedang tampil."""
+        is_boss_room = node["is_boss_room"]
+        fill = _COL_FILL_DEAD if (is_boss_room and boss_cleared) else node["fill"]
 
         if is_player:
-            pen = QPen(QColor(_COL_BORDER_PLAY))
-            pen.setWidth(3)
+            pen_key = (_COL_BORDER_PLAY, 3)
         elif is_locked:
-            pen = QPen(QColor(_COL_BORDER_LOCK))
-            pen.setWidth(2)
-        elif room_type == "boss" and boss_name and not boss_cleared:
-            pen = QPen(QColor(_COL_BORDER_BOSS))
-            pen.setWidth(2)
+            pen_key = (_COL_BORDER_LOCK, 2)
+        elif is_boss_room and boss_name and not boss_cleared:
+            pen_key = (_COL_BORDER_BOSS, 2)
         else:
-            pen = QPen(QColor(_COL_BORDER_NORM))
-            pen.setWidth(1)
-        rect.setPen(pen)
+            pen_key = (_COL_BORDER_NORM, 1)
+
+        style = (fill, pen_key)
+        if style == node["style"]:
+            return False
+        node["style"] = style
+        return True
 
     def _build_status_section(self, parent_layout: QVBoxLayout) -> None:
         """Build the Player Status panel appended below the map."""
-        status_frame = QFrame()
+        self._status_frame = status_frame = QFrame()
         status_frame.setStyleSheet(
             f"QFrame {{ background-color: {_COL_STATUS_BG}; "
             f"border-top: 1px solid #2a2a3a; border-radius: 0px; }}"
@@ -319,10 +545,8 @@ class MapPanel(QWidget):
         )
         sf_layout.addWidget(ps_title)
 
-        # HP row: [heart icon] hp_label
-        hp_row = QWidget()
-        hp_row.setStyleSheet("background: transparent;")
-        hp_h = QHBoxLayout(hp_row)
+        # HP row: [heart icon] hp_label — layout langsung, tanpa QWidget pembungkus
+        hp_h = QHBoxLayout()
         hp_h.setContentsMargins(0, 4, 0, 0)
         hp_h.setSpacing(8)
 
@@ -339,14 +563,12 @@ class MapPanel(QWidget):
             "font-size: 14px; font-weight: bold; color: #e06060; "
             "background: transparent; border: none;"
         )
+        # Label mengisi sisa lebar (teks rata kiri) — tidak perlu stretch
         hp_h.addWidget(self.lbl_ps_hp)
-        hp_h.addStretch()
-        sf_layout.addWidget(hp_row)
+        sf_layout.addLayout(hp_h)
 
         # Bag icon row
-        bag_row = QWidget()
-        bag_row.setStyleSheet("background: transparent;")
-        bag_h = QHBoxLayout(bag_row)
+        bag_h = QHBoxLayout()
         bag_h.setContentsMargins(0, 4, 0, 0)
         bag_h.setSpacing(8)
 
@@ -356,9 +578,8 @@ class MapPanel(QWidget):
             self._icon_bag.setPixmap(px)
         self._icon_bag.setFixedSize(_ICON_SIZE, _ICON_SIZE)
         self._icon_bag.setStyleSheet("background: transparent; border: none;")
-        bag_h.addWidget(self._icon_bag)
-        bag_h.addStretch()
-        sf_layout.addWidget(bag_row)
+        bag_h.addWidget(self._icon_bag, alignment=Qt.AlignmentFlag.AlignLeft)
+        sf_layout.addLayout(bag_h)
 
         # Weapon / Armor / Bag text
         for attr in ("lbl_ps_weapon", "lbl_ps_armor", "lbl_ps_bag"):
@@ -378,59 +599,78 @@ class MapPanel(QWidget):
 
         parent_layout.addWidget(status_frame, stretch=4)
 
-    def _build_html(self, room_id: str, is_locked: bool, boss_name: str | None, boss_cleared: bool, items_list: list[str], monsters: list[str]) -> str:
-        lock_str   = " 🔒" if is_locked else ""
-        name_color = _COL_NAME_DIM if boss_cleared else _COL_NAME
-
-        lines = [
-            f'<div style="text-align: center; font-family: \'{FONT_BODY}\', serif;">'
-            f'<span style="font-size:11px; font-weight:bold; color:{name_color};">'
-            f"{_ROOM_NAMES[room_id]}{lock_str}</span>"
-        ]
-
+    def _label_lines(self, title_line: tuple[str, tuple], boss_name: str | None, boss_cleared: bool, items_list: tuple[str, ...], monsters: tuple[str, ...]) -> tuple[tuple[str, tuple], ...]:
         if boss_name:
-            if boss_cleared:
-                lines.append(f'<br><span style="font-size:9px; color:{_COL_NAME_DIM};">{boss_name} [dead]</span>')
-            else:
-                lines.append(f'<br><span style="font-size:10px; font-weight:bold; color:{_COL_BOSS_ALIVE};">{boss_name}</span>')
-
-        for m in monsters:
-            lines.append(f'<br><span style="font-size:9px; color:{_COL_MONSTER};">{m}</span>')
+            boss_line = (_boss_dead_text(boss_name), _LINE_BOSS_DEAD) if boss_cleared else (boss_name, _LINE_BOSS_ALIVE)
+            head = (title_line, boss_line)
+        else:
+            head = (title_line,)
+        return (
+            head
+            + tuple((m, _LINE_MONSTER) for m in monsters)
+            + tuple((itm, _LINE_ITEM) for itm in items_list[:2])
+        )
 
-        for itm in items_list[:2]:
-            lines.append(f'<br><span style="font-size:9px; color:{_COL_ITEM};">{itm}</span>')
-        
-        lines.append('</div>')
-        return "".join(lines)
+    def _refresh_node(self, node: dict) -> None:
+        """Pasang pixmap node untuk (style, label) saat ini, render bila belum ada di cache."""
+        dpr = self._view.devicePixelRatioF()
+        key = (node["style"], node["label"], dpr)
+        px = self._node_pixmaps.get(key)
+        if px is None:
+            if len(self._node_pixmaps) >= _NODE_PIXMAP_CACHE_MAX:
+                self._node_pixmaps.clear()
+            px = self._node_pixmaps[key] = _render_node(*node["style"], node["label"], dpr)
+        node["item"].setPixmap(px)
 
     # ── Player Status public slots ─────────────────────────────────────────────
 
+    def update_player(self, player_hp: PlayerHP | None = None, inventory: dict | None = None) -> None:
+        """Apply HP and/or inventory to the Player Status panel in one repaint."""
+        self._status_frame.setUpdatesEnabled(False)
+        try:
+            if player_hp is not None:
+                hp_text = _HP_FMT(*player_hp)
+                if hp_text != self._last_hp_text:
+                    self.lbl_ps_hp.setText(hp_text)
+                    self._last_hp_text = hp_text
+            if inventory is not None:
+                self._apply_inventory(inventory)
+        finally:
+            self._status_frame.setUpdatesEnabled(True)
+
     def update_player_hp(self, hp: int, max_hp: int) -> None:
         """Update the HP display in the Player Status panel."""
-        self.lbl_ps_hp.setText(f"{hp}/{max_hp}")
+        self.update_player(PlayerHP(hp, max_hp))
 
     def update_player_status(self, payload: dict) -> None:
         """
         Slot for inventory_updated signal.
         payload = {"equipped": {slot: item_dict | None}, "bag": [item_dicts]}
         """
+        self.update_player(inventory=payload)
+
+    def _apply_inventory(self, payload: dict) -> None:
         equipped = payload.get("equipped", {})
         bag      = payload.get("bag", [])
 
+        # setText dengan teks yang sama tetap meng-invalidasi layout label — dilewati
         w = equipped.get("weapon")
-        self.lbl_ps_weapon.setText(
-            f"Weapon: {w['name']}  (ATK {w.get('damage', 0)})" if w else "Weapon: [none]"
-        )
-
-        _ARMOR_SLOTS = ("helmet", "suit", "legs", "shoes", "cloak", "shield")
-        parts = [
-            f"{slot.title()}: {equipped[slot]['name']} (DEF {equipped[slot].get('defense', 0)})"
-            for slot in _ARMOR_SLOTS if equipped.get(slot)
-        ]
-        self.lbl_ps_armor.setText(
-            "Armor: " + "  |  ".join(parts) if parts else "Armor: [none]"
-        )
+        weapon_text = _WEAPON_FMT(w["name"], w.get("damage", 0)) if w else "Weapon: [none]"
+        if weapon_text != self._last_weapon_text:
+            self.lbl_ps_weapon.setText(weapon_text)
+            self._last_weapon_text = weapon_text
+
+        # Satu scan slot armor: key untuk diff sekaligus bahan teks
+        armor = [(prefix, item) for slot, prefix in _ARMOR_PREFIXES if (item := equipped.get(slot))]
+        armor_key = tuple((prefix, item["name"]) for prefix, item in armor)
+        if armor_key != self._last_armor_key:
+            parts = [_ARMOR_FMT(prefix, item["name"], item.get("defense", 0)) for prefix, item in armor]
+            self.lbl_ps_armor.setText(
+                "Armor: " + "  |  ".join(parts) if parts else "Armor: [none]"
+            )
+            self._last_armor_key = armor_key
 
-        self.lbl_ps_bag.setText(
-            "Bag: " + ",  ".join(i["name"] for i in bag) if bag else ""
-        )
+        bag_text = "Bag: " + ",  ".join(i["name"] for i in bag) if bag else ""
+        if bag_text != self._last_bag_text:
+            self.lbl_ps_bag.setText(bag_text)
+            self._last_bag_text = bag_text
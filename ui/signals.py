@@ -1,19 +1,45 @@
+from typing import NamedTuple
+
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
+class PlayerHP(NamedTuple):
+    """HP player yang ikut state_updated sebagai argumen kedua."""
+    hp: int
+    max_hp: int
+
+
+class RoomView(NamedTuple):
+    """Isi satu ruangan di map_state_changed."""
+    items: tuple[str, ...]
+    monsters: tuple[str, ...]
+    boss: str | None
+    boss_cleared: bool
+    locked: bool
+
+
+class MapState(NamedTuple):
+    """Snapshot dunia untuk MapPanel: posisi player + RoomView per room_id."""
+    player_room: str
+    rooms: dict[str, RoomView]
+
+
 class AppSignals(QObject):
     """
     Central signal bus for the entire application.
 
     Must be instantiated on the main thread before any worker threads start.
     All cross-thread communication goes through this object.
+    Dict/list payloads are declared as `object` so PyQt passes the Python
+    reference through instead of converting to QVariantMap/QVariantList.
 
     Signals emitted FROM worker threads (auto-queued to main thread by Qt):
         narration_started       NarrationWorker has begun
         narration_finished      NarrationWorker done; audio is playing
         narration_text(str)     Full narration text — displayed persistently in centre pane
-        state_updated(dict)     Room/player state changed — UI should refresh
-                                payload: {"room": {...}, "exits": {...}, "player": {...}}
+        state_updated(dict, PlayerHP)
+                                Room/player state changed — UI should refresh
+                                payload: {"room": {...}, "exits": {...}}
         listening_started       Mic is open and streaming
         transcript_delta(str)   Partial transcription text (live display)
         processing_started      STT finished; intent parsing has begun
@@ -25,7 +51,7 @@ class AppSignals(QObject):
     narration_started   = pyqtSignal()
     narration_finished  = pyqtSignal()
     narration_text      = pyqtSignal(str)
-    state_updated       = pyqtSignal(dict)
+    state_updated       = pyqtSignal(object, object)   # (view payload dict, PlayerHP)
     listening_started   = pyqtSignal()
     transcript_delta    = pyqtSignal(str)
     processing_started  = pyqtSignal()
@@ -34,14 +60,14 @@ class AppSignals(QObject):
     game_won            = pyqtSignal(str, str)   # (room_name, wav_path)
 
     # Phase 2 — combat + items
-    combat_started     = pyqtSignal(dict)   # {name, player_hp, player_max_hp, enemy_hp, enemy_max_hp}
-    combat_updated     = pyqtSignal(dict)   # {player_hp, player_max_hp, enemy_hp, enemy_max_hp}
+    combat_started     = pyqtSignal(object)   # {name, player_hp, player_max_hp, enemy_hp, enemy_max_hp}
+    combat_updated     = pyqtSignal(object)   # {name, player_hp, player_max_hp, enemy_hp, enemy_max_hp}
     combat_ended       = pyqtSignal()       # enemy defeated, back to exploration
-    inventory_updated  = pyqtSignal(dict)   # {"equipped": {slot: item_dict|None}, "bag": [item_dicts]}
-    room_items_changed = pyqtSignal(list)   # list of item dicts in current room
+    inventory_updated  = pyqtSignal(object)   # {"equipped": {slot: item_dict|None}, "bag": [item_dicts]}
+    room_items_changed = pyqtSignal(object)   # list of item dicts in current room
 
     # Phase 3 — death
     game_over          = pyqtSignal(str, str)   # (narration_text, wav_path)
 
     # Phase 3.2 — debug map panel
-    map_state_changed  = pyqtSignal(dict)   # full world snapshot for MapPanel
+    map_state_changed  = pyqtSignal(object)   # MapState — full world snapshot for MapPanel